@@ -13,6 +13,10 @@ def get_database_path() -> Path:
     return get_base_dir() / "student_mgmt.db"
 
 
+def get_archive_database_path() -> Path:
+    return get_base_dir() / "student_mgmt_archive.db"
+
+
 def get_settings_path() -> Path:
     return get_base_dir() / "settings.json"
 
@@ -22,6 +26,7 @@ def _default_settings() -> Dict[str, Any]:
         "theme": "flatly",
         "geometry": "1024x640",
         "zoomed": False,
+        "archive_cutoff_year": None,
     }
 
 
@@ -5,18 +5,27 @@ from pathlib import Path
 from typing import Iterator
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
 
 try:
-    from .config import get_database_path
+    from .config import get_archive_database_path, get_database_path
 except ImportError:  # Running as a script without package context
-    from config import get_database_path
+    from config import get_archive_database_path, get_database_path
+
+
+ARCHIVE_SCHEMA = "archive"
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class ArchiveBase(DeclarativeBase):
+    # Tables living in the attached archive database. Kept out of Base.metadata
+    # so init_database() never tries to create them on the main connection.
+    pass
+
+
 def _sqlite_url(db_path: Path) -> str:
     return f"sqlite:///{db_path.as_posix()}"
 
@@ -51,6 +60,83 @@ def init_database() -> None:
     except ImportError:  # Running as a script without package context
         import models  # noqa: F401
 
+    _migrate_students_autoincrement()
     Base.metadata.create_all(bind=engine)
 
 
+def _migrate_students_autoincrement() -> None:
+    # Tables created before archiving existed let SQLite reuse the highest ids
+    # once those rows leave the hot table, which would clash with archived ids.
+    # SQLite can't ALTER that in place, so rebuild the table with AUTOINCREMENT.
+    try:
+        from .models import Student
+    except ImportError:  # Running as a script without package context
+        from models import Student
+
+    with engine.connect() as conn:
+        ddl = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'students'"
+        ).scalar()
+        if ddl is None or "AUTOINCREMENT" in ddl.upper():
+            return
+        columns = ", ".join(c.name for c in Student.__table__.columns)
+        # pysqlite only opens transactions for DML; begin explicitly so the
+        # rebuild is all-or-nothing.
+        conn.exec_driver_sql("BEGIN")
+        try:
+            conn.exec_driver_sql("ALTER TABLE students RENAME TO students_old")
+            Student.__table__.create(bind=conn)
+            conn.exec_driver_sql(
+                f"INSERT INTO students ({columns}) SELECT {columns} FROM students_old"
+            )
+            conn.exec_driver_sql("DROP TABLE students_old")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+
+@contextmanager
+def get_archive_session() -> Iterator[Session]:
+    """Yield a session whose connection has the archive database attached.
+
+    The archive file is attached as the ``archive`` schema only for the
+    lifetime of the session and detached again afterwards, so regular
+    sessions keep working against the hot database alone.
+    """
+    try:
+        from . import models  # noqa: F401
+    except ImportError:  # Running as a script without package context
+        import models  # noqa: F401
+
+    with engine.connect() as conn:
+        # ATTACH/DETACH cannot run inside an open SQLite transaction, so commit
+        # around them and give the session its own transaction in between.
+        conn.exec_driver_sql(
+            f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}",
+            (get_archive_database_path().as_posix(),),
+        )
+        try:
+            ArchiveBase.metadata.create_all(bind=conn)
+            # create_all skips indexes on tables that already exist
+            for table in ArchiveBase.metadata.tables.values():
+                for index in table.indexes:
+                    index.create(bind=conn, checkfirst=True)
+            conn.commit()
+            session = Session(bind=conn, autoflush=False, expire_on_commit=False)
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        finally:
+            try:
+                conn.rollback()
+                conn.exec_driver_sql(f"DETACH DATABASE {ARCHIVE_SCHEMA}")
+                conn.commit()
+            except Exception:
+                # Never hand a connection with a stale attachment back to the pool
+                conn.invalidate()
@@ -3,20 +3,18 @@ from __future__ import annotations
 from datetime import date
 from typing import Dict, Any
 
-from sqlalchemy import Integer, String, Date, UniqueConstraint
+from sqlalchemy import Integer, String, Date, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 try:
-    from .database import Base
+    from .database import ARCHIVE_SCHEMA, ArchiveBase, Base
 except ImportError:  # Running as a script without package context
-    from database import Base
+    from database import ARCHIVE_SCHEMA, ArchiveBase, Base
 
 
-class Student(Base):
-    __tablename__ = "students"
-    __table_args__ = (
-        UniqueConstraint("email", name="uq_students_email"),
-    )
+class StudentColumnsMixin:
+    # Shared by the hot table and its archive copy so both stay column-compatible
+    archived = False
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     full_name: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -37,7 +35,31 @@ class Student(Base):
             "enrollment_year": self.enrollment_year if self.enrollment_year is not None else "",
         }
 
+
+class Student(StudentColumnsMixin, Base):
+    __tablename__ = "students"
+    __table_args__ = (
+        UniqueConstraint("email", name="uq_students_email"),
+        # Never hand out an id again once its row moves to the archive
+        {"sqlite_autoincrement": True},
+    )
+
     def __repr__(self) -> str:  # pragma: no cover - debug helper only
         return f"<Student id={self.id} name={self.full_name!r} email={self.email!r}>"
 
 
+class ArchivedStudent(StudentColumnsMixin, ArchiveBase):
+    # No unique email here: an address can be reused by a later cohort that
+    # gets archived too.
+    __tablename__ = "students"
+    __table_args__ = (
+        # Restore picks the newest row per email; without this it scans the
+        # whole archive once per archived row.
+        Index("ix_archive_students_email", "email"),
+        {"schema": ARCHIVE_SCHEMA},
+    )
+
+    archived = True
+
+    def __repr__(self) -> str:  # pragma: no cover - debug helper only
+        return f"<ArchivedStudent id={self.id} name={self.full_name!r} email={self.email!r}>"
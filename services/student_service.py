@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import heapq
+from dataclasses import dataclass
 from datetime import date
 from typing import Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, func, insert, select, true
 
 try:
-    from ..database import get_session
-    from ..models import Student
+    from ..database import get_archive_session, get_session
+    from ..models import ArchivedStudent, Student, StudentColumnsMixin
 except ImportError:  # Running as a script without package context
-    from database import get_session
-    from models import Student
+    from database import get_archive_session, get_session
+    from models import ArchivedStudent, Student, StudentColumnsMixin
+
+
+@dataclass
+class ArchiveResult:
+    moved: int = 0
+    skipped: int = 0
 
 
 def create_student(
@@ -41,14 +49,31 @@ def get_student(student_id: int) -> Optional[Student]:
         return session.get(Student, student_id)
 
 
-def list_students(query: str | None = None) -> List[Student]:
-    with get_session() as session:
-        stmt = select(Student)
-        if query:
-            q = f"%{query.lower()}%"
-            stmt = stmt.where((Student.full_name.ilike(q)) | (Student.email.ilike(q)))
-        stmt = stmt.order_by(Student.full_name.asc())
-        return list(session.scalars(stmt).all())
+def _search_stmt(model, query: str | None):
+    stmt = select(model)
+    if query:
+        q = f"%{query.lower()}%"
+        stmt = stmt.where((model.full_name.ilike(q)) | (model.email.ilike(q)))
+    return stmt.order_by(model.full_name.asc())
+
+
+def list_students(
+    query: str | None = None,
+    include_archive: bool = False,
+) -> List[StudentColumnsMixin]:
+    """Return hot students, optionally merged with archived ones.
+
+    With ``include_archive`` both sets are merged and sorted by ``full_name``.
+    Archived rows come back as ``ArchivedStudent`` instances (``archived`` is
+    True); they share ids with the hot table's id space and are read-only.
+    """
+    if not include_archive:
+        with get_session() as session:
+            return list(session.scalars(_search_stmt(Student, query)).all())
+    with get_archive_session() as session:
+        hot = session.scalars(_search_stmt(Student, query)).all()
+        archived = session.scalars(_search_stmt(ArchivedStudent, query)).all()
+        return list(heapq.merge(hot, archived, key=lambda s: s.full_name))
 
 
 def update_student(
@@ -96,3 +121,64 @@ def delete_students(student_ids: Iterable[int]) -> int:
         return count
 
 
+def _count(session, table, *criteria) -> int:
+    return session.scalar(select(func.count()).select_from(table).where(*criteria)) or 0
+
+
+def _move_rows(session, source, target, due, *guards) -> int:
+    # Both tables share StudentColumnsMixin, so the hot table's columns cover both
+    columns = [c.name for c in Student.__table__.columns]
+    moved = session.execute(
+        insert(target).from_select(
+            columns,
+            select(*(source.c[name] for name in columns)).where(due, *guards),
+        )
+    ).rowcount
+    # Only drop source rows whose copy now exists in the target. Both tables are
+    # called "students", so the subquery side needs an alias to correlate.
+    copy = target.alias("copy")
+    copied = exists().where(copy.c.id == source.c.id, copy.c.email == source.c.email)
+    session.execute(delete(source).where(due, copied))
+    return moved
+
+
+def archive_students(cutoff_year: int) -> ArchiveResult:
+    """Move students enrolled before ``cutoff_year`` into the archive database.
+
+    Runs as set-based INSERT ... SELECT / DELETE statements in one transaction.
+    """
+    hot = Student.__table__
+    archive = ArchivedStudent.__table__
+    with get_archive_session() as session:
+        due = hot.c.enrollment_year < cutoff_year
+        total = _count(session, hot, due)
+        moved = _move_rows(session, hot, archive, due, hot.c.id.not_in(select(archive.c.id)))
+        return ArchiveResult(moved=moved, skipped=total - moved)
+
+
+def restore_students(min_year: Optional[int] = None) -> ArchiveResult:
+    """Move archived students back into the hot table.
+
+    Only rows enrolled in ``min_year`` or later are restored when it is given,
+    otherwise the whole archive is. Rows whose email is already used by a hot
+    student stay in the archive and are reported as skipped; if the archive
+    holds the same email more than once, the newest row is restored.
+    """
+    hot = Student.__table__
+    archive = ArchivedStudent.__table__
+    taken = hot.alias("taken")
+    newer = archive.alias("newer")
+    with get_archive_session() as session:
+        due = archive.c.enrollment_year >= min_year if min_year is not None else true()
+        newer_due = newer.c.enrollment_year >= min_year if min_year is not None else true()
+        total = _count(session, archive, due)
+        moved = _move_rows(
+            session,
+            archive,
+            hot,
+            due,
+            ~exists().where(taken.c.id == archive.c.id),
+            ~exists().where(taken.c.email == archive.c.email),
+            ~exists().where(newer.c.email == archive.c.email, newer.c.id > archive.c.id, newer_due),
+        )
+        return ArchiveResult(moved=moved, skipped=total - moved)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import csv
+import threading
 from pathlib import Path
 from typing import List, Optional
 
 import ttkbootstrap as ttkb
 from ttkbootstrap.constants import BOTH, LEFT, RIGHT, X, Y, YES, NO
-from ttkbootstrap.dialogs import Messagebox
+from ttkbootstrap.dialogs import Messagebox, Querybox
 
 try:
     from ..config import load_settings, save_settings
@@ -15,6 +16,8 @@ try:
         list_students,
         update_student,
         delete_students,
+        archive_students,
+        restore_students,
     )
 except ImportError:  # Running as a script without package context
     from config import load_settings, save_settings
@@ -23,6 +26,8 @@ except ImportError:  # Running as a script without package context
         list_students,
         update_student,
         delete_students,
+        archive_students,
+        restore_students,
     )
 from .student_form import StudentForm, StudentFormData
 
@@ -41,6 +46,7 @@ class StudentManagementApp(ttkb.Window):
             except Exception:
                 pass
 
+        self._job_running = False
         self._build_toolbar()
         self._build_table()
         self._refresh_table()
@@ -51,20 +57,44 @@ class StudentManagementApp(ttkb.Window):
         bar = ttkb.Frame(self, padding=(10, 8))
         bar.pack(fill=X)
 
+        # Everything that touches the database, disabled while an archive job runs
+        self._db_controls: list = []
+
         self.search_var = ttkb.StringVar()
         ttkb.Entry(bar, textvariable=self.search_var, width=40).pack(side=LEFT, padx=(0, 8))
-        ttkb.Button(bar, text="Search", bootstyle="secondary", command=self._on_search).pack(side=LEFT, padx=(0, 8))
-        ttkb.Button(bar, text="Add", bootstyle="success", command=self._on_add).pack(side=LEFT)
-        ttkb.Button(bar, text="Edit", bootstyle="warning", command=self._on_edit).pack(side=LEFT, padx=(8, 0))
-        ttkb.Button(bar, text="Delete", bootstyle="danger", command=self._on_delete).pack(side=LEFT, padx=(8, 0))
+        self._db_button(bar, text="Search", bootstyle="secondary", command=self._on_search).pack(side=LEFT, padx=(0, 8))
+        self._db_button(bar, text="Add", bootstyle="success", command=self._on_add).pack(side=LEFT)
+        self._db_button(bar, text="Edit", bootstyle="warning", command=self._on_edit).pack(side=LEFT, padx=(8, 0))
+        self._db_button(bar, text="Delete", bootstyle="danger", command=self._on_delete).pack(side=LEFT, padx=(8, 0))
 
         bar2 = ttkb.Frame(self)
         bar2.pack(fill=X)
-        ttkb.Button(bar2, text="Import CSV", bootstyle="info", command=self._on_import).pack(side=LEFT)
-        ttkb.Button(bar2, text="Export CSV", bootstyle="info", command=self._on_export).pack(side=LEFT, padx=(8, 0))
+        self._db_button(bar2, text="Import CSV", bootstyle="info", command=self._on_import).pack(side=LEFT)
+        self._db_button(bar2, text="Export CSV", bootstyle="info", command=self._on_export).pack(side=LEFT, padx=(8, 0))
+        self._db_button(bar2, text="Archive...", bootstyle="secondary", command=self._on_archive).pack(side=LEFT, padx=(8, 0))
+        self._db_button(bar2, text="Restore Archive", bootstyle="secondary", command=self._on_restore).pack(side=LEFT, padx=(8, 0))
+        self.include_archive_var = ttkb.BooleanVar(value=False)
+        toggle = ttkb.Checkbutton(
+            bar2,
+            text="Include archive",
+            variable=self.include_archive_var,
+            bootstyle="round-toggle",
+            command=self._on_search,
+        )
+        toggle.pack(side=LEFT, padx=(8, 0))
+        self._db_controls.append(toggle)
 
         ttkb.Button(bar2, text="Toggle Theme", bootstyle="secondary", command=self._on_toggle_theme).pack(side=RIGHT)
 
+    def _db_button(self, parent, **kwargs) -> ttkb.Button:
+        button = ttkb.Button(parent, **kwargs)
+        self._db_controls.append(button)
+        return button
+
+    def _set_db_controls_state(self, state: str) -> None:
+        for widget in self._db_controls:
+            widget.configure(state=state)
+
     def _build_table(self) -> None:
         columns = ("id", "full_name", "email", "phone", "address", "date_of_birth", "enrollment_year")
         tree = ttkb.Treeview(self, columns=columns, show="headings", height=20, bootstyle="table")
@@ -72,15 +102,19 @@ class StudentManagementApp(ttkb.Window):
         for col in columns:
             tree.heading(col, text=col.replace("_", " ").title())
             tree.column(col, anchor="w", width=140 if col != "address" else 240)
+        tree.tag_configure("archived", foreground="gray")
         tree.pack(fill=BOTH, expand=YES, padx=10, pady=10)
-        tree.bind("<Double-1>", lambda e: self._on_edit())
+        tree.bind("<Double-1>", lambda e: self._on_edit() if not self._job_running else None)
 
     def _refresh_table(self, query: Optional[str] = None) -> None:
         for row in self.tree.get_children():
             self.tree.delete(row)
-        students = list_students(query=query)
+        students = list_students(query=query, include_archive=self.include_archive_var.get())
         for s in students:
-            self.tree.insert("", "end", iid=str(s.id), values=(
+            # The archive- prefix is how _has_archived_selection spots read-only rows
+            iid = f"archive-{s.id}" if s.archived else str(s.id)
+            tags = ("archived",) if s.archived else ()
+            self.tree.insert("", "end", iid=iid, tags=tags, values=(
                 s.id,
                 s.full_name,
                 s.email,
@@ -92,7 +126,13 @@ class StudentManagementApp(ttkb.Window):
 
     def _get_selected_ids(self) -> List[int]:
         sel = self.tree.selection()
-        return [int(s) for s in sel]
+        return [int(s) for s in sel if s.isdigit()]
+
+    def _has_archived_selection(self) -> bool:
+        if any(not s.isdigit() for s in self.tree.selection()):
+            Messagebox.show_info("Archived students are read-only. Restore them first.")
+            return True
+        return False
 
     def _on_search(self) -> None:
         self._refresh_table(self.search_var.get().strip() or None)
@@ -113,6 +153,8 @@ class StudentManagementApp(ttkb.Window):
             self._refresh_table(self.search_var.get().strip() or None)
 
     def _on_edit(self) -> None:
+        if self._has_archived_selection():
+            return
         ids = self._get_selected_ids()
         if not ids:
             Messagebox.show_info("Please select a row to edit.")
@@ -147,6 +189,8 @@ class StudentManagementApp(ttkb.Window):
             self._refresh_table(self.search_var.get().strip() or None)
 
     def _on_delete(self) -> None:
+        if self._has_archived_selection():
+            return
         ids = self._get_selected_ids()
         if not ids:
             Messagebox.show_info("Please select at least one row to delete.")
@@ -202,7 +246,10 @@ class StudentManagementApp(ttkb.Window):
         )
         if not path:
             return
-        students = list_students(query=self.search_var.get().strip() or None)
+        students = list_students(
+            query=self.search_var.get().strip() or None,
+            include_archive=self.include_archive_var.get(),
+        )
         with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.DictWriter(
                 f,
@@ -229,6 +276,56 @@ class StudentManagementApp(ttkb.Window):
                 })
         Messagebox.show_info(f"Exported {len(students)} students.")
 
+    def _on_archive(self) -> None:
+        cutoff = Querybox.get_integer(
+            prompt="Archive students enrolled before year:",
+            title="Archive Students",
+            initialvalue=self.settings.get("archive_cutoff_year"),
+            parent=self,
+        )
+        if cutoff is None:
+            return
+        self.settings["archive_cutoff_year"] = cutoff
+        save_settings(self.settings)
+        self._run_archive_job("Archived", archive_students, cutoff)
+
+    def _on_restore(self) -> None:
+        if Messagebox.okcancel("Move all archived students back to the main list?") == "OK":
+            self._run_archive_job("Restored", restore_students)
+
+    def _run_archive_job(self, verb: str, job, *args) -> None:
+        # Bulk moves can take a while on large tables; keep the UI responsive but
+        # block other database access until the worker's transaction is done
+        self._job_running = True
+        self._set_db_controls_state("disabled")
+        outcome: dict = {}
+
+        def worker() -> None:
+            try:
+                outcome["result"] = job(*args)
+            except Exception as exc:
+                outcome["error"] = exc
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        self._poll_archive_job(thread, verb, outcome)
+
+    def _poll_archive_job(self, thread: threading.Thread, verb: str, outcome: dict) -> None:
+        if thread.is_alive():
+            self.after(200, self._poll_archive_job, thread, verb, outcome)
+            return
+        self._job_running = False
+        self._set_db_controls_state("normal")
+        if "error" in outcome:
+            Messagebox.show_error(f"Archive operation failed: {outcome['error']}")
+            return
+        result = outcome["result"]
+        message = f"{verb} {result.moved} students."
+        if result.skipped:
+            message += f" Skipped {result.skipped} conflicting rows."
+        Messagebox.show_info(message)
+        self._refresh_table(self.search_var.get().strip() or None)
+
     def _on_toggle_theme(self) -> None:
         current = self.style.theme.name
         alt = "darkly" if current != "darkly" else "flatly"